@@ -6,6 +6,18 @@ This makes it very convenient for frequency counting without checking key existe
 """
 
 from collections import Counter
+from functools import lru_cache
+
+# Number of distinct query patterns whose Counter is kept around
+PATTERN_CACHE_SIZE = 1024
+
+@lru_cache(maxsize=PATTERN_CACHE_SIZE)
+def _pattern_counter(pattern):
+    """
+    Build the Counter for a query pattern once and reuse it on later calls.
+    The cached Counter is shared, so callers must treat it as read-only.
+    """
+    return Counter(pattern)
 
 def access_operations():
     """Demonstrates various ways to access counter values"""
@@ -103,15 +115,14 @@ def dsa_use_cases():
         left = 0
         max_length = 0
         
-        for right in range(len(s)):
+        for right, char in enumerate(s):
             # Add current character
-            char_count[s[right]] += 1
+            char_count[char] += 1
             
             # Shrink window while we have duplicates
-            while char_count[s[right]] > 1:
+            # (zero counts are left in place; only the duplicate check reads them)
+            while char_count[char] > 1:
                 char_count[s[left]] -= 1
-                if char_count[s[left]] == 0:
-                    del char_count[s[left]]
                 left += 1
             
             max_length = max(max_length, right - left + 1)
@@ -131,31 +142,45 @@ def dsa_use_cases():
         Check if s1's permutation is a substring of s2.
         Time Complexity: O(n)
         """
-        if len(s1) > len(s2):
+        window_size = len(s1)
+        if window_size > len(s2):
             return False
         
-        s1_count = Counter(s1)
-        window_count = Counter()
+        s1_count = _pattern_counter(s1)
+        required = len(s1_count)
         
         # Initialize sliding window
-        for i in range(len(s1)):
-            window_count[s2[i]] += 1
+        window_count = Counter(s2[:window_size])
         
-        if window_count == s1_count:
+        # Number of distinct s1 characters whose window count matches exactly.
+        # Updating it per step avoids comparing the whole Counters each slide.
+        matched = sum(1 for char, count in s1_count.items()
+                      if window_count[char] == count)
+        
+        if matched == required:
             return True
         
         # Slide the window
-        for i in range(len(s1), len(s2)):
+        for i in range(window_size, len(s2)):
             # Add new character
-            window_count[s2[i]] += 1
+            new_char = s2[i]
+            if new_char in s1_count:
+                window_count[new_char] += 1
+                if window_count[new_char] == s1_count[new_char]:
+                    matched += 1
+                elif window_count[new_char] == s1_count[new_char] + 1:
+                    matched -= 1
             
             # Remove old character
-            old_char = s2[i - len(s1)]
-            window_count[old_char] -= 1
-            if window_count[old_char] == 0:
-                del window_count[old_char]
+            old_char = s2[i - window_size]
+            if old_char in s1_count:
+                window_count[old_char] -= 1
+                if window_count[old_char] == s1_count[old_char]:
+                    matched += 1
+                elif window_count[old_char] == s1_count[old_char] - 1:
+                    matched -= 1
             
-            if window_count == s1_count:
+            if matched == required:
                 return True
         
         return False
@@ -177,7 +202,8 @@ def dsa_use_cases():
         if not s or not t or len(s) < len(t):
             return ""
         
-        t_count = Counter(t)
+        t_count = _pattern_counter(t)
+        t_chars = set(t_count)  # Plain set for the per-character membership tests
         required = len(t_count)
         formed = 0
         
@@ -186,14 +212,14 @@ def dsa_use_cases():
         min_len = float('inf')
         min_left = 0
         
-        for right in range(len(s)):
-            # Add character to window
-            char = s[right]
-            window_count[char] += 1
-            
-            # Check if frequency matches
-            if char in t_count and window_count[char] == t_count[char]:
-                formed += 1
+        for right, char in enumerate(s):
+            # Only characters of t affect the answer, so only they are counted
+            if char in t_chars:
+                window_count[char] += 1
+                
+                # Check if frequency matches
+                if window_count[char] == t_count[char]:
+                    formed += 1
             
             # Contract window
             while formed == required and left <= right:
@@ -203,10 +229,11 @@ def dsa_use_cases():
                     min_left = left
                 
                 # Remove leftmost character
-                char = s[left]
-                window_count[char] -= 1
-                if char in t_count and window_count[char] < t_count[char]:
-                    formed -= 1
+                left_char = s[left]
+                if left_char in t_chars:
+                    window_count[left_char] -= 1
+                    if window_count[left_char] < t_count[left_char]:
+                        formed -= 1
                 
                 left += 1
         
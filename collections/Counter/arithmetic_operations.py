@@ -5,7 +5,16 @@ Counter supports mathematical operations like addition, subtraction,
 intersection, and union. Very useful for set operations and frequency analysis in DSA.
 """
 
-from collections import Counter
+from collections import Counter, defaultdict
+from functools import lru_cache
+
+# How many recently seen patterns keep their Counter cached
+PATTERN_CACHE_SIZE = 1024
+
+@lru_cache(maxsize=PATTERN_CACHE_SIZE)
+def _pattern_counter(pattern):
+    """Cached Counter of a pattern string; shared between calls, so never modify it."""
+    return Counter(pattern)
 
 def arithmetic_operations():
     """Demonstrates arithmetic operations between counters"""
@@ -83,14 +92,14 @@ def dsa_use_cases():
         Find minimum steps to make s and t anagrams by removing characters.
         Return the number of characters to remove.
         """
+        # Only the pattern t is cached; one-off texts would just push it out
         counter_s = Counter(s)
-        counter_t = Counter(t)
+        counter_t = _pattern_counter(t)
         
-        # Characters that need to be removed from both strings
-        diff_s = counter_s - counter_t  # Extra chars in s
-        diff_t = counter_t - counter_s  # Extra chars in t
-        
-        return sum(diff_s.values()) + sum(diff_t.values())
+        # Characters that need to be removed from both strings:
+        # extra chars in s plus extra chars in t, summed in one pass
+        all_chars = counter_s.keys() | counter_t.keys()
+        return sum(abs(counter_s[char] - counter_t[char]) for char in all_chars)
     
     s = "programming"
     t = "gaming"
@@ -132,10 +141,13 @@ def dsa_use_cases():
         Merge multiple frequency maps into one.
         Useful for combining results from different sources.
         """
-        result = Counter()
+        # Accumulate into a plain defaultdict and wrap it once at the end;
+        # Counter.update on a non-empty Counter goes through a Python loop
+        totals = defaultdict(int)
         for freq_map in freq_maps:
-            result.update(freq_map)
-        return result
+            for key, count in freq_map.items():
+                totals[key] += count
+        return Counter(totals)
     
     map1 = {'apple': 3, 'banana': 2}
     map2 = {'apple': 1, 'orange': 4}
@@ -52,7 +52,11 @@ def dsa_use_case():
     
     # Problem: Check if two strings are anagrams
     def are_anagrams(str1, str2):
-        return Counter(str1.lower()) == Counter(str2.lower())
+        str1, str2 = str1.lower(), str2.lower()
+        # Different lengths can never be anagrams; skip counting entirely
+        if len(str1) != len(str2):
+            return False
+        return Counter(str1) == Counter(str2)
     
     test_cases = [
         ("listen", "silent"),
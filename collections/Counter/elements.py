@@ -5,7 +5,9 @@ The elements() method returns an iterator over elements repeating each
 as many times as its count. Useful for reconstructing original data or sampling.
 """
 
+from bisect import bisect
 from collections import Counter
+from itertools import accumulate
 
 def elements_examples():
     """Demonstrates usage of the elements() method"""
@@ -60,22 +62,37 @@ def dsa_use_cases():
     print("2. Weighted Random Sampling:")
     import random
     
+    def weighted_sampler(counter):
+        """
+        Build a function that picks elements in proportion to their counts.
+        Cumulative weights are computed once, so each draw is a binary search
+        over the K distinct keys instead of materializing all N elements.
+        """
+        keys = [key for key, count in counter.items() if count > 0]
+        cumulative = list(accumulate(counter[key] for key in keys))
+        
+        def sample():
+            if not keys:
+                return None
+            return keys[bisect(cumulative, random.random() * cumulative[-1])]
+        
+        return sample
+    
     def weighted_random_choice(counter):
         """
         Choose a random element based on its frequency weight.
         Higher frequency = higher probability of selection.
         """
-        elements = list(counter.elements())
-        if not elements:
-            return None
-        return random.choice(elements)
+        return weighted_sampler(counter)()
     
     # Simulate rolling a biased die
     biased_die = Counter({1: 1, 2: 1, 3: 2, 4: 2, 5: 3, 6: 3})
     print(f"Biased die frequencies: {biased_die}")
+    print(f"Single weighted roll: {weighted_random_choice(biased_die)}")
     
-    # Sample multiple times to see distribution
-    samples = [weighted_random_choice(biased_die) for _ in range(20)]
+    # Sample multiple times to see distribution (weights prepared once)
+    roll_die = weighted_sampler(biased_die)
+    samples = [roll_die() for _ in range(20)]
     sample_counter = Counter(samples)
     print(f"20 random samples: {samples}")
     print(f"Sample distribution: {sample_counter}")
@@ -103,10 +120,11 @@ def dsa_use_cases():
     def validate_distribution(original, counter):
         """
         Check if a counter correctly represents the frequency of original data.
+        Compares frequency maps directly instead of sorting both expansions.
+        Time Complexity: O(n)
         """
-        reconstructed = sorted(counter.elements())
-        original_sorted = sorted(original)
-        return reconstructed == original_sorted
+        # Unary + drops zero/negative counts, just like elements() skips them
+        return Counter(original) == +counter
     
     original_data = ['a', 'b', 'b', 'c', 'c', 'c']
     counter = Counter(original_data)
@@ -81,9 +81,11 @@ def dsa_use_cases():
         Time Complexity: O(n)
         """
         counter = Counter(s)
-        for i, char in enumerate(s):
-            if counter[char] == 1:
-                return i
+        # Counter keys keep first-occurrence order, so scanning the K distinct
+        # keys replaces a second Python-level pass over the whole string
+        for char, count in counter.items():
+            if count == 1:
+                return s.index(char)
         return -1
     
     test_string = "leetcode"
@@ -102,10 +104,8 @@ def dsa_use_cases():
         Time Complexity: O(n log n)
         """
         counter = Counter(s)
-        result = ""
-        for char, count in counter.most_common():
-            result += char * count
-        return result
+        # Join once instead of growing a new string on every iteration
+        return "".join(char * count for char, count in counter.most_common())
     
     test_string = "tree"
     result = frequency_sort(test_string)
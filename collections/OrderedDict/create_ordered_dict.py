@@ -52,7 +52,7 @@ def insertion_order_demonstration():
     print("Adding items in this order:")
     for key, value in items:
         od[key] = value
-        print(f"Added '{key}': {value} -> {list(od.keys())}")
+        print(f"Added '{key}': {value} -> {list(od)}")
     
     print(f"\nFinal OrderedDict: {od}")
     print(f"Keys in insertion order: {list(od.keys())}")
@@ -136,21 +136,25 @@ def key_position_matters():
     
     print("--- Why Order Matters ---")
     
+    # These examples only need insertion order (no move_to_end/popitem(last=False)),
+    # so a plain dict is enough: it keeps order since Python 3.7 and is lighter
+    # than OrderedDict, which maintains an extra linked list of keys.
+    
     # Example 1: Configuration with precedence
     print("1. Configuration with precedence:")
-    config = OrderedDict([
-        ('env', 'production'),
-        ('debug', False),
-        ('database_url', 'prod://db'),
-        ('cache_timeout', 3600)
-    ])
+    config = {
+        'env': 'production',
+        'debug': False,
+        'database_url': 'prod://db',
+        'cache_timeout': 3600
+    }
     
     print("Configuration (order shows precedence):")
     for key, value in config.items():
         print(f"  {key}: {value}")
     
     # Override settings (maintain precedence order)
-    overrides = OrderedDict([('debug', True), ('cache_timeout', 1800)])
+    overrides = {'debug': True, 'cache_timeout': 1800}
     config.update(overrides)
     
     print("After applying overrides:")
@@ -160,13 +164,13 @@ def key_position_matters():
     
     # Example 2: Steps in a process
     print("2. Process steps (order is crucial):")
-    process_steps = OrderedDict([
-        ('validate_input', 'Check input parameters'),
-        ('authenticate', 'Verify user credentials'),
-        ('authorize', 'Check user permissions'),
-        ('process_request', 'Execute main logic'),
-        ('log_result', 'Record operation result')
-    ])
+    process_steps = {
+        'validate_input': 'Check input parameters',
+        'authenticate': 'Verify user credentials',
+        'authorize': 'Check user permissions',
+        'process_request': 'Execute main logic',
+        'log_result': 'Record operation result'
+    }
     
     print("Process execution order:")
     for i, (step, description) in enumerate(process_steps.items(), 1):
@@ -181,34 +185,17 @@ def iteration_patterns():
     od = OrderedDict([('first', 1), ('second', 2), ('third', 3), ('fourth', 4)])
     print(f"OrderedDict: {od}")
     
-    # Forward iteration
+    # Forward iteration (each line is built first and printed once)
     print("\n1. Forward iteration:")
-    print("Keys:", end=" ")
-    for key in od:
-        print(key, end=" ")
-    print()
-    
-    print("Values:", end=" ")
-    for value in od.values():
-        print(value, end=" ")
-    print()
-    
-    print("Items:", end=" ")
-    for key, value in od.items():
-        print(f"({key},{value})", end=" ")
-    print()
+    print("Keys:", " ".join(map(str, od)))
+    print("Values:", " ".join(map(str, od.values())))
+    print("Items:", " ".join(f"({key},{value})" for key, value in od.items()))
     
     # Reverse iteration
     print("\n2. Reverse iteration:")
-    print("Keys (reversed):", end=" ")
-    for key in reversed(od):
-        print(key, end=" ")
-    print()
-    
-    print("Items (reversed):", end=" ")
-    for key, value in reversed(od.items()):
-        print(f"({key},{value})", end=" ")
-    print()
+    print("Keys (reversed):", " ".join(map(str, reversed(od))))
+    print("Items (reversed):",
+          " ".join(f"({key},{value})" for key, value in reversed(od.items())))
     print()
 
 def dsa_use_case():
@@ -222,30 +209,35 @@ def dsa_use_case():
         This demonstrates the foundation for LRU implementation.
         """
         
+        # No per-instance __dict__: only these attributes are ever set
+        __slots__ = ('capacity', 'cache')
+        
         def __init__(self, capacity):
             self.capacity = capacity
             self.cache = OrderedDict()
         
         def get(self, key):
             """Get value and mark as recently used"""
-            if key not in self.cache:
+            try:
+                # Move to end (most recently used); raises KeyError on a miss
+                self.cache.move_to_end(key)
+            except KeyError:
                 return -1
-            
-            # Move to end (most recently used)
-            value = self.cache.pop(key)
-            self.cache[key] = value
-            return value
+            return self.cache[key]
         
         def put(self, key, value):
             """Put key-value pair, evict LRU if needed"""
             if key in self.cache:
                 # Update existing key (move to end)
-                self.cache.pop(key)
-            elif len(self.cache) >= self.capacity:
+                self.cache[key] = value
+                self.cache.move_to_end(key)
+                return
+            
+            if len(self.cache) >= self.capacity:
                 # Remove least recently used (first item)
                 self.cache.popitem(last=False)
             
-            # Add/update key as most recently used
+            # Add new key as most recently used
             self.cache[key] = value
         
         def __str__(self):
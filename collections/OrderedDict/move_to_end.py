@@ -14,31 +14,31 @@ def basic_move_to_end():
     
     od = OrderedDict([('a', 1), ('b', 2), ('c', 3), ('d', 4), ('e', 5)])
     print(f"Initial OrderedDict: {od}")
-    print(f"Order: {list(od.keys())}")
+    print(f"Order: {list(od)}")
     print()
     
     # Move to end (default: last=True)
     print("1. Moving to end (most recent):")
     od.move_to_end('b')
     print(f"After move_to_end('b'): {od}")
-    print(f"Order: {list(od.keys())}")
+    print(f"Order: {list(od)}")
     print()
     
     od.move_to_end('d')
     print(f"After move_to_end('d'): {od}")
-    print(f"Order: {list(od.keys())}")
+    print(f"Order: {list(od)}")
     print()
     
     # Move to beginning (last=False)
     print("2. Moving to beginning (least recent):")
     od.move_to_end('c', last=False)
     print(f"After move_to_end('c', last=False): {od}")
-    print(f"Order: {list(od.keys())}")
+    print(f"Order: {list(od)}")
     print()
     
     od.move_to_end('e', last=False)
     print(f"After move_to_end('e', last=False): {od}")
-    print(f"Order: {list(od.keys())}")
+    print(f"Order: {list(od)}")
     print()
 
 def error_handling():
@@ -56,7 +56,7 @@ def error_handling():
         print(f"move_to_end('missing'): KeyError - {e}")
     
     # Check that original order is unchanged
-    print(f"Order unchanged: {list(od.keys())}")
+    print(f"Order unchanged: {list(od)}")
     print()
 
 def frequent_access_pattern():
@@ -82,15 +82,18 @@ def frequent_access_pattern():
     access_sequence = ['user3', 'user1', 'user5', 'user2', 'user3', 'user1']
     
     print("Simulating access pattern (moving accessed items to end):")
+    trace = []
     for accessed_user in access_sequence:
-        print(f"\nAccess {accessed_user}:")
+        trace.append(f"\nAccess {accessed_user}:")
         cache.move_to_end(accessed_user)
         
-        print("  Cache order (oldest -> newest):")
-        for i, (key, value) in enumerate(cache.items(), 1):
-            print(f"    {i}. {key}: {value}")
+        trace.append("  Cache order (oldest -> newest):")
+        trace.extend(f"    {i}. {key}: {value}"
+                     for i, (key, value) in enumerate(cache.items(), 1))
+    # Print the collected trace once instead of once per line
+    print("\n".join(trace))
     
-    print(f"\nFinal order: {list(cache.keys())}")
+    print(f"\nFinal order: {list(cache)}")
     print("Most recently accessed items are at the end")
     print()
 
@@ -99,48 +102,59 @@ def priority_queue_simulation():
     
     print("--- Priority Queue with Dynamic Priorities ---")
     
-    # Task queue with priorities (lower number = higher priority)
+    # Task queue with priorities (lower number = higher priority).
+    # Order and descriptions live in the OrderedDict; priorities are kept in a
+    # separate flat dict, so sorting only touches task_id -> int entries.
     tasks = OrderedDict([
-        ('task_A', {'priority': 3, 'description': 'Low priority task'}),
-        ('task_B', {'priority': 1, 'description': 'High priority task'}),
-        ('task_C', {'priority': 2, 'description': 'Medium priority task'}),
-        ('task_D', {'priority': 3, 'description': 'Another low priority task'})
+        ('task_A', 'Low priority task'),
+        ('task_B', 'High priority task'),
+        ('task_C', 'Medium priority task'),
+        ('task_D', 'Another low priority task')
     ])
-    
-    def sort_by_priority(task_dict):
-        """Sort tasks by priority using move_to_end"""
-        # Create list of (task_id, priority) sorted by priority
-        sorted_tasks = sorted(task_dict.items(), key=lambda x: x[1]['priority'])
+    priorities = {'task_A': 3, 'task_B': 1, 'task_C': 2, 'task_D': 3}
+    
+    def sort_by_priority(task_dict, task_priority):
+        """Sort tasks by priority in place"""
+        # Decorate-sort-undecorate: read each priority once into a plain tuple
+        # so the sort compares tuples in C with no lambda calls. The position
+        # breaks ties, keeping equal priorities in their current order.
+        decorated = [(task_priority[task_id], position, task_id)
+                     for position, task_id in enumerate(task_dict)]
+        decorated.sort()
+        sorted_tasks = [(task_id, task_dict[task_id]) for _, _, task_id in decorated]
         
-        # Move tasks to maintain priority order
-        for task_id, _ in sorted_tasks:
-            task_dict.move_to_end(task_id)
-    
-    def print_tasks(task_dict, title):
-        print(f"{title}:")
-        for i, (task_id, task_info) in enumerate(task_dict.items(), 1):
-            priority = task_info['priority']
-            desc = task_info['description']
-            print(f"  {i}. {task_id} (priority {priority}): {desc}")
+        # A full reorder is cheaper as one bulk rebuild than as
+        # one move_to_end per task
+        task_dict.clear()
+        task_dict.update(sorted_tasks)
+    
+    def print_tasks(task_dict, task_priority, title):
+        lines = [f"{title}:"]
+        for i, (task_id, desc) in enumerate(task_dict.items(), 1):
+            priority = task_priority[task_id]
+            lines.append(f"  {i}. {task_id} (priority {priority}): {desc}")
+        # One print call for the whole block instead of one per task
+        print("\n".join(lines))
         print()
     
-    print_tasks(tasks, "Initial task order")
+    print_tasks(tasks, priorities, "Initial task order")
     
     # Sort by priority
-    sort_by_priority(tasks)
-    print_tasks(tasks, "After sorting by priority")
+    sort_by_priority(tasks, priorities)
+    print_tasks(tasks, priorities, "After sorting by priority")
     
     # Change priority of a task
     print("Changing task_A priority from 3 to 1 (highest):")
-    tasks['task_A']['priority'] = 1
-    sort_by_priority(tasks)
-    print_tasks(tasks, "After priority change")
+    priorities['task_A'] = 1
+    sort_by_priority(tasks, priorities)
+    print_tasks(tasks, priorities, "After priority change")
     
     # Add new urgent task
     print("Adding urgent task with priority 0:")
-    tasks['task_E'] = {'priority': 0, 'description': 'URGENT task'}
-    sort_by_priority(tasks)
-    print_tasks(tasks, "After adding urgent task")
+    tasks['task_E'] = 'URGENT task'
+    priorities['task_E'] = 0
+    sort_by_priority(tasks, priorities)
+    print_tasks(tasks, priorities, "After adding urgent task")
 
 def lru_cache_implementation():
     """Complete LRU cache implementation using move_to_end"""
@@ -153,17 +167,21 @@ def lru_cache_implementation():
         Time Complexity: O(1) for both get and put operations.
         """
         
+        __slots__ = ('capacity', 'cache')
+        
         def __init__(self, capacity):
             self.capacity = capacity
             self.cache = OrderedDict()
         
         def get(self, key):
             """Get value and mark as most recently used"""
-            if key not in self.cache:
+            # EAFP: a hit skips the separate membership test,
+            # move_to_end raises KeyError on a miss
+            try:
+                # Move to end (most recently used)
+                self.cache.move_to_end(key)
+            except KeyError:
                 return -1
-            
-            # Move to end (most recently used)
-            self.cache.move_to_end(key)
             return self.cache[key]
         
         def put(self, key, value):
@@ -176,8 +194,7 @@ def lru_cache_implementation():
                 # Check capacity
                 if len(self.cache) >= self.capacity:
                     # Remove least recently used (first item)
-                    lru_key = next(iter(self.cache))
-                    del self.cache[lru_key]
+                    lru_key, _ = self.cache.popitem(last=False)
                     print(f"    Evicted LRU key: {lru_key}")
                 
                 # Add new key-value pair
@@ -221,42 +238,34 @@ def performance_comparison():
     
     import time
     
-    # Method 1: Using move_to_end
-    def access_with_move_to_end(od, key):
-        """Access item using move_to_end"""
-        if key in od:
-            od.move_to_end(key)
-            return od[key]
-        return None
-    
-    # Method 2: Delete and re-insert (less efficient)
-    def access_with_delete_insert(od, key):
-        """Access item by deleting and re-inserting"""
-        if key in od:
-            value = od.pop(key)
-            od[key] = value
-            return value
-        return None
-    
-    # Setup test data
+    # Setup test data: build once and copy, so both methods start from
+    # identical dictionaries without repeating the 10k-item build
     size = 10000
-    od1 = OrderedDict((i, f"value_{i}") for i in range(size))
-    od2 = OrderedDict((i, f"value_{i}") for i in range(size))
+    template = OrderedDict((i, f"value_{i}") for i in range(size))
+    od1 = template.copy()
+    od2 = template.copy()
     
     # Test keys to access
     test_keys = list(range(0, size, 100))  # Every 100th key
     
-    # Test move_to_end method
-    start_time = time.time()
+    # Loop bodies are inlined (no helper call per key) and timed with the
+    # nanosecond perf_counter, so the numbers reflect the OrderedDict work
+    
+    # Method 1: Using move_to_end
+    start_time = time.perf_counter_ns()
     for key in test_keys:
-        access_with_move_to_end(od1, key)
-    move_to_end_time = time.time() - start_time
+        if key in od1:
+            od1.move_to_end(key)
+            value = od1[key]
+    move_to_end_time = (time.perf_counter_ns() - start_time) / 1e9
     
-    # Test delete-insert method
-    start_time = time.time()
+    # Method 2: Delete and re-insert (less efficient)
+    start_time = time.perf_counter_ns()
     for key in test_keys:
-        access_with_delete_insert(od2, key)
-    delete_insert_time = time.time() - start_time
+        if key in od2:
+            value = od2.pop(key)
+            od2[key] = value
+    delete_insert_time = (time.perf_counter_ns() - start_time) / 1e9
     
     print(f"Accessing {len(test_keys)} keys in OrderedDict of size {size:,}:")
     print(f"move_to_end method: {move_to_end_time:.6f} seconds")
@@ -274,24 +283,50 @@ def dsa_use_cases():
     class MRUList:
         """Maintains a list of most recently used items"""
         
+        __slots__ = ('max_size', 'items', '_cached_mru')
+        
         def __init__(self, max_size=5):
             self.max_size = max_size
-            self.items = OrderedDict()
+            # Used as an ordered set: a plain dict keeps insertion order
+            # (Python 3.7+) and is smaller than an OrderedDict
+            self.items = {}
+            self._cached_mru = None
         
         def access(self, item):
             """Mark item as most recently used"""
             if item in self.items:
-                self.items.move_to_end(item)
+                # dict has no move_to_end; re-inserting moves the key to the end
+                self.items[item] = self.items.pop(item)
             else:
                 if len(self.items) >= self.max_size:
-                    # Remove least recently used
-                    oldest = next(iter(self.items))
-                    del self.items[oldest]
-                self.items[item] = True
+                    # Remove least recently used (first key)
+                    del self.items[next(iter(self.items))]
+                self.items[item] = None
+            # Order changed, so the cached MRU list is stale
+            self._cached_mru = None
+        
+        def bulk_load(self, items):
+            """
+            Replace the contents with a history (any iterable) ordered oldest
+            to newest, ending in the same state as calling access() on each
+            item. Duplicates are dropped from the newest end, since a repeated
+            access moves an item to the newest position; dict.fromkeys does
+            this in C instead of one access() per item.
+            """
+            items = list(items)  # reversed() needs a sequence, not a generator
+            newest = list(dict.fromkeys(reversed(items)))[:self.max_size]
+            self.items = dict.fromkeys(reversed(newest))
+            self._cached_mru = None
         
         def get_mru_list(self):
-            """Get items in MRU order (most recent first)"""
-            return list(reversed(self.items.keys()))
+            """
+            Get items in MRU order (most recent first).
+            The result is rebuilt only after an access and shared between
+            reads, so it is a tuple that callers cannot modify.
+            """
+            if self._cached_mru is None:
+                self._cached_mru = tuple(reversed(self.items))
+            return self._cached_mru
     
     mru = MRUList(4)
     access_sequence = ['file1.txt', 'file2.txt', 'file3.txt', 'file1.txt', 
@@ -301,19 +336,33 @@ def dsa_use_cases():
     for file in access_sequence:
         mru.access(file)
         print(f"  Access '{file}': MRU list = {mru.get_mru_list()}")
+    
+    # Warm start from a saved history (oldest first, may contain repeats)
+    history = ['notes.md', 'main.py', 'README.md', 'notes.md', 'setup.py', 'todo.txt']
+    restored = MRUList(4)
+    restored.bulk_load(history)
+    print(f"  Restored from history: MRU list = {restored.get_mru_list()}")
+    
+    replayed = MRUList(4)
+    for file in history:
+        replayed.access(file)
+    print(f"  Matches replaying access(): {restored.get_mru_list() == replayed.get_mru_list()}")
     print()
     
     # Use Case 2: Dynamic Priority Queue
     print("2. Dynamic Priority Reordering:")
     def reorder_by_priority(od, priorities):
         """Reorder OrderedDict based on new priorities"""
-        # Sort items by their new priorities
-        sorted_items = sorted(od.items(), key=lambda x: priorities.get(x[0], float('inf')))
+        # Sort items by their new priorities (decorated once, ties keep order)
+        missing = float('inf')
+        decorated = [(priorities.get(key, missing), position, key)
+                     for position, key in enumerate(od)]
+        decorated.sort()
+        sorted_items = [(key, od[key]) for _, _, key in decorated]
         
-        # Move items to maintain the new order
-        for key, _ in sorted_items:
-            if key in od:
-                od.move_to_end(key)
+        # Rebuild in the new order (move_to_end is for moving a few keys)
+        od.clear()
+        od.update(sorted_items)
     
     # Process queue
     processes = OrderedDict([
@@ -323,7 +372,7 @@ def dsa_use_cases():
         ('proc_D', 'Process D')
     ])
     
-    print(f"Initial process order: {list(processes.keys())}")
+    print(f"Initial process order: {list(processes)}")
     
     # Change priorities
     new_priorities = {
@@ -334,7 +383,7 @@ def dsa_use_cases():
     }
     
     reorder_by_priority(processes, new_priorities)
-    print(f"After priority reordering: {list(processes.keys())}")
+    print(f"After priority reordering: {list(processes)}")
     print("Order now reflects: proc_C -> proc_A -> proc_D -> proc_B")
 
 if __name__ == "__main__":
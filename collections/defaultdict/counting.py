@@ -5,7 +5,9 @@ defaultdict(int) is perfect for counting operations since it automatically
 initializes missing keys with 0. Essential for frequency analysis in algorithms.
 """
 
-from collections import defaultdict
+from collections import Counter, defaultdict
+from itertools import chain
+from math import comb
 
 def basic_counting():
     """Demonstrates basic counting operations with defaultdict"""
@@ -46,10 +48,8 @@ def count_list_elements():
     
     numbers = [1, 2, 3, 2, 1, 3, 4, 2, 1, 5, 4, 3]
     
-    # Count frequencies
-    frequency = defaultdict(int)
-    for num in numbers:
-        frequency[num] += 1
+    # Count frequencies (Counter runs the counting loop in C)
+    frequency = Counter(numbers)
     
     print(f"Numbers: {numbers}")
     print("Frequency count:")
@@ -57,7 +57,7 @@ def count_list_elements():
         print(f"  {num}: {frequency[num]} times")
     
     # Find most frequent element
-    most_frequent = max(frequency.items(), key=lambda x: x[1])
+    most_frequent = frequency.most_common(1)[0]
     print(f"Most frequent: {most_frequent[0]} (appears {most_frequent[1]} times)")
     print()
 
@@ -67,18 +67,15 @@ def count_words():
     print("--- Word Counting ---")
     
     text = "the quick brown fox jumps over the lazy dog the fox is quick"
-    words = text.split()
-    
-    word_count = defaultdict(int)
-    for word in words:
-        word_count[word.lower()] += 1
+    # Lowercase the whole text once, then let Counter consume the word
+    # list directly (no per-word lower() call or generator step)
+    word_count = Counter(text.lower().split())
     
     print(f"Text: '{text}'")
     print("Word frequencies:")
     
     # Sort by frequency (descending)
-    sorted_words = sorted(word_count.items(), key=lambda x: x[1], reverse=True)
-    for word, count in sorted_words:
+    for word, count in word_count.most_common():
         print(f"  '{word}': {count}")
     print()
 
@@ -99,7 +96,9 @@ def incremental_counting():
     print("Processing events:")
     for event_type, user in events:
         counter[event_type] += 1
-        print(f"Event: {event_type} by {user} - Count: {dict(counter)}")
+        # Report only the count that changed; copying the whole dict for
+        # every event would make the loop O(n^2)
+        print(f"Event: {event_type} by {user} - {event_type} count: {counter[event_type]}")
     
     print(f"\nFinal event counts: {dict(counter)}")
     print()
@@ -155,15 +154,15 @@ def dsa_use_cases():
         Find all pairs that sum to target, handle duplicates.
         Time Complexity: O(n), Space Complexity: O(n)
         """
-        count = defaultdict(int)
         pairs = []
         
-        # Count frequencies
-        for num in nums:
-            count[num] += 1
+        # Count frequencies (Counter counts in C and keeps first-seen order)
+        count = Counter(nums)
         
         seen = set()
-        for num in nums:
+        # Repeats of a number can never add a new pair, so walking the
+        # distinct numbers gives the same pairs in the same order
+        for num in count:
             complement = target - num
             
             if complement in count and complement not in seen:
@@ -195,18 +194,11 @@ def dsa_use_cases():
         Find the first character that appears exactly once.
         Time Complexity: O(n), Space Complexity: O(1) for limited alphabet
         """
-        count = defaultdict(int)
-        
-        # Count all characters
-        for char in s:
-            count[char] += 1
-        
-        # Find first character with count 1
-        for char in s:
-            if count[char] == 1:
-                return char
+        # Count all characters; Counter keeps keys in first-seen order
+        count = Counter(s)
         
-        return None
+        # Find first character with count 1 (scans distinct chars, not s)
+        return next((char for char, freq in count.items() if freq == 1), None)
     
     test_strings = ["leetcode", "loveleetcode", "programming", "aabbcc"]
     for s in test_strings:
@@ -219,16 +211,22 @@ def dsa_use_cases():
     def find_majority_element(nums):
         """
         Find element that appears more than n/2 times.
-        Time Complexity: O(n), Space Complexity: O(n)
+        Uses Boyer-Moore voting, so no frequency dict is needed.
+        Time Complexity: O(n), Space Complexity: O(1)
         """
-        count = defaultdict(int)
-        n = len(nums)
+        candidate, votes = None, 0
         
         for num in nums:
-            count[num] += 1
-            if count[num] > n // 2:
-                return num
+            if votes == 0:
+                candidate, votes = num, 1
+            elif num == candidate:
+                votes += 1
+            else:
+                votes -= 1
         
+        # The vote only yields a candidate; confirm it (list.count runs in C)
+        if candidate is not None and nums.count(candidate) > len(nums) // 2:
+            return candidate
         return None
     
     test_arrays = [
@@ -249,45 +247,49 @@ def dsa_use_cases():
         """
         Count how many valid triangles can be formed.
         A triangle is valid if sum of any two sides > third side.
+        Works on the k distinct lengths with a two-pointer sweep per longest
+        side, so it does O(k^2) steps instead of checking all k^3 triples.
         """
-        from collections import Counter
-        
         # Count frequency of each side length
         side_count = defaultdict(int)
         for side in sides:
             side_count[side] += 1
         
-        valid_triangles = 0
-        sides_list = list(side_count.keys())
-        n = len(sides_list)
+        # Distinct positive lengths in ascending order, with their frequencies
+        # in a parallel list (index lookups instead of dict lookups).
+        # For sorted a <= b <= c, the triangle test reduces to a + b > c.
+        lengths = sorted(side for side in side_count if side > 0)
+        freqs = [side_count[side] for side in lengths]
         
-        # Check all combinations
-        for i in range(n):
-            for j in range(i, n):
-                for k in range(j, n):
-                    a, b, c = sides_list[i], sides_list[j], sides_list[k]
-                    
-                    # Check triangle inequality
-                    if a + b > c and b + c > a and a + c > b:
-                        # Calculate number of such triangles based on frequency
-                        if i == j == k:  # All same
-                            freq = side_count[a]
-                            if freq >= 3:
-                                # C(freq, 3) combinations
-                                valid_triangles += freq * (freq - 1) * (freq - 2) // 6
-                        elif i == j:  # Two same, one different
-                            freq_a = side_count[a]
-                            freq_c = side_count[c]
-                            if freq_a >= 2:
-                                # C(freq_a, 2) * freq_c
-                                valid_triangles += (freq_a * (freq_a - 1) // 2) * freq_c
-                        elif j == k:  # Two same, one different
-                            freq_a = side_count[a]
-                            freq_b = side_count[b]
-                            if freq_b >= 2:
-                                valid_triangles += freq_a * (freq_b * (freq_b - 1) // 2)
-                        else:  # All different
-                            valid_triangles += side_count[a] * side_count[b] * side_count[c]
+        # prefix[i] = number of sides shorter than lengths[i]
+        prefix = [0]
+        for freq in freqs:
+            prefix.append(prefix[-1] + freq)
+        
+        valid_triangles = 0
+        for k, longest in enumerate(lengths):
+            freq_k = freqs[k]
+            
+            # All three sides the same length: C(freq, 3)
+            valid_triangles += comb(freq_k, 3)
+            
+            # Two sides equal to the longest, one shorter side: always valid
+            valid_triangles += prefix[k] * comb(freq_k, 2)
+            
+            # Two equal shorter sides a, a with a + a > longest
+            for j in range(k):
+                if 2 * lengths[j] > longest:
+                    valid_triangles += comb(freqs[j], 2) * freq_k
+            
+            # Three different lengths a < b < longest: two pointers
+            lo, hi = 0, k - 1
+            while lo < hi:
+                if lengths[lo] + lengths[hi] > longest:
+                    # Every length from lo to hi - 1 pairs with lengths[hi]
+                    valid_triangles += (prefix[hi] - prefix[lo]) * freqs[hi] * freq_k
+                    hi -= 1
+                else:
+                    lo += 1
         
         return valid_triangles
     
@@ -304,17 +306,12 @@ def dsa_use_cases():
         Analyze the degree distribution of vertices in a graph.
         Time Complexity: O(E), Space Complexity: O(V)
         """
-        vertex_degree = defaultdict(int)
-        
-        # Count degree for each vertex
-        for u, v in edges:
-            vertex_degree[u] += 1
-            vertex_degree[v] += 1
+        # Count degree for each vertex: every edge endpoint adds one, so
+        # count the flattened endpoints in a single C-level pass
+        vertex_degree = Counter(chain.from_iterable(edges))
         
-        # Count vertices by degree
-        degree_count = defaultdict(int)
-        for vertex, degree in vertex_degree.items():
-            degree_count[degree] += 1
+        # Count vertices by degree (a histogram of the degrees)
+        degree_count = Counter(vertex_degree.values())
         
         return vertex_degree, degree_count
     
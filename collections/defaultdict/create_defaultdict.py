@@ -168,12 +168,13 @@ def dsa_use_case():
     
     # BFS using defaultdict for visited tracking
     def bfs(graph, start):
-        """BFS traversal using defaultdict for clean code"""
+        """BFS traversal over the defaultdict adjacency list"""
         from collections import deque
         
-        visited = defaultdict(bool)  # Default: False
+        # A set stores only visited vertices; a defaultdict(bool) would
+        # insert a False entry for every vertex it is merely asked about
+        visited = {start}
         queue = deque([start])
-        visited[start] = True
         result = []
         
         while queue:
@@ -181,8 +182,8 @@ def dsa_use_case():
             result.append(vertex)
             
             for neighbor in graph[vertex]:
-                if not visited[neighbor]:  # Clean check without KeyError
-                    visited[neighbor] = True
+                if neighbor not in visited:
+                    visited.add(neighbor)
                     queue.append(neighbor)
         
         return result
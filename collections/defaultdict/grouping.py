@@ -5,7 +5,7 @@ defaultdict is excellent for grouping data by categories without
 explicitly checking if keys exist. Very common in data processing and algorithms.
 """
 
-from collections import defaultdict
+from collections import Counter, defaultdict
 
 def basic_grouping():
     """Demonstrates basic grouping operations with defaultdict"""
@@ -223,10 +223,8 @@ def dsa_use_cases():
         Group elements by their frequency of occurrence.
         Time Complexity: O(n)
         """
-        # Count frequencies
-        frequency_count = defaultdict(int)
-        for element in elements:
-            frequency_count[element] += 1
+        # Count frequencies (Counter does this loop in C)
+        frequency_count = Counter(elements)
         
         # Group by frequency
         frequency_groups = defaultdict(list)
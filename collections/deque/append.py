@@ -7,6 +7,11 @@ Essential for implementing queues, stacks, and double-ended data structures.
 
 from collections import deque
 
+# bytes.translate tables for cleaning ASCII text in one C pass:
+# map A-Z to a-z and delete everything that is not alphanumeric
+_ASCII_LOWER = bytes.maketrans(b'ABCDEFGHIJKLMNOPQRSTUVWXYZ', b'abcdefghijklmnopqrstuvwxyz')
+_ASCII_NON_ALNUM = bytes(c for c in range(128) if not chr(c).isalnum())
+
 def append_operations():
     """Demonstrates append and appendleft operations"""
     
@@ -105,6 +110,8 @@ def dsa_use_cases():
     # Use Case 1: Implement a queue
     print("1. Queue Implementation:")
     class Queue:
+        __slots__ = ('items',)
+        
         def __init__(self):
             self.items = deque()
         
@@ -112,6 +119,10 @@ def dsa_use_cases():
             """Add item to rear of queue - O(1)"""
             self.items.append(item)
         
+        def enqueue_many(self, items):
+            """Add several items to rear of queue in one C-level extend - O(k)"""
+            self.items.extend(items)
+        
         def dequeue(self):
             """Remove item from front of queue - O(1)"""
             if self.items:
@@ -125,7 +136,7 @@ def dsa_use_cases():
             raise IndexError("Queue is empty")
         
         def is_empty(self):
-            return len(self.items) == 0
+            return not self.items
         
         def size(self):
             return len(self.items)
@@ -143,23 +154,29 @@ def dsa_use_cases():
     while not queue.is_empty():
         item = queue.dequeue()
         print(f"Dequeue {item}: {queue}")
+    
+    queue.enqueue_many(range(1, 4))
+    print(f"\nBulk enqueue_many(range(1, 4)): {queue}")
     print()
     
-    # Use Case 2: Palindrome checker using deque
+    # Use Case 2: Palindrome checker
     print("2. Palindrome Checker:")
     def is_palindrome(s):
         """
-        Check if string is palindrome using deque.
+        Check if string is palindrome. ASCII input is cleaned with one
+        bytes.translate call; other text is cleaned character by character.
         Time Complexity: O(n), Space Complexity: O(n)
         """
-        # Clean string - remove non-alphanumeric and convert to lowercase
-        cleaned = ''.join(char.lower() for char in s if char.isalnum())
-        dq = deque(cleaned)
+        if s.isascii():
+            # Clean and lowercase the whole string in C, then compare
+            cleaned = s.encode('ascii').translate(_ASCII_LOWER, _ASCII_NON_ALNUM)
+            return cleaned == cleaned[::-1]
         
-        while len(dq) > 1:
-            if dq.popleft() != dq.pop():
-                return False
-        return True
+        # Clean string - remove non-alphanumeric and convert to lowercase.
+        # Some characters lowercase to two (e.g. 'İ'), so compare the whole
+        # cleaned string rather than one lowered character at a time
+        cleaned = ''.join(char.lower() for char in s if char.isalnum())
+        return cleaned == cleaned[::-1]
     
     test_strings = [
         "A man a plan a canal Panama",
@@ -187,20 +204,23 @@ def dsa_use_cases():
         dq = deque()  # Store indices
         result = []
         
-        for i in range(len(nums)):
-            # Remove indices outside current window
-            while dq and dq[0] <= i - k:
-                dq.popleft()
+        push, pop, popleft = dq.append, dq.pop, dq.popleft
+        emit = result.append
+        
+        for i, value in enumerate(nums):
+            # At most one index leaves the window per step
+            if dq and dq[0] == i - k:
+                popleft()
             
             # Remove indices of smaller elements (they can't be maximum)
-            while dq and nums[dq[-1]] <= nums[i]:
-                dq.pop()
+            while dq and nums[dq[-1]] <= value:
+                pop()
             
-            dq.append(i)
+            push(i)
             
             # Add maximum of current window to result
             if i >= k - 1:
-                result.append(nums[dq[0]])
+                emit(nums[dq[0]])
         
         return result
     
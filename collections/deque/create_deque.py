@@ -98,6 +98,8 @@ def dsa_use_case():
     print("--- DSA Use Case: BFS on Binary Tree ---")
     
     class TreeNode:
+        __slots__ = ('val', 'left', 'right')
+        
         def __init__(self, val=0, left=None, right=None):
             self.val = val
             self.left = left
@@ -118,19 +120,21 @@ def dsa_use_case():
         queue = deque([root])  # deque is perfect for BFS queue
         
         while queue:
-            level_size = len(queue)
+            # Children go into a fresh deque, so the current level can be
+            # iterated directly without counting pops against a level size
+            next_level = deque()
             level_nodes = []
             
-            for _ in range(level_size):
-                node = queue.popleft()  # O(1) operation
+            for node in queue:
                 level_nodes.append(node.val)
                 
                 if node.left:
-                    queue.append(node.left)   # O(1) operation
+                    next_level.append(node.left)   # O(1) operation
                 if node.right:
-                    queue.append(node.right)  # O(1) operation
+                    next_level.append(node.right)  # O(1) operation
             
             result.append(level_nodes)
+            queue = next_level
         
         return result
     
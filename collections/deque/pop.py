@@ -112,6 +112,8 @@ def dsa_use_cases():
     # Use Case 1: Stack implementation
     print("1. Stack Implementation:")
     class Stack:
+        __slots__ = ('items',)
+        
         def __init__(self):
             self.items = deque()
         
@@ -119,6 +121,10 @@ def dsa_use_cases():
             """Push item onto stack - O(1)"""
             self.items.append(item)
         
+        def push_many(self, items):
+            """Push several items onto stack in one C-level extend - O(k)"""
+            self.items.extend(items)
+        
         def pop(self):
             """Pop item from stack - O(1)"""
             if self.items:
@@ -132,7 +138,7 @@ def dsa_use_cases():
             raise IndexError("Stack is empty")
         
         def is_empty(self):
-            return len(self.items) == 0
+            return not self.items
         
         def size(self):
             return len(self.items)
@@ -150,6 +156,9 @@ def dsa_use_cases():
     while not stack.is_empty():
         item = stack.pop()
         print(f"Pop {item}: {stack}")
+    
+    stack.push_many(range(1, 5))
+    print(f"\nBulk push_many(range(1, 5)): {stack}")
     print()
     
     # Use Case 2: Valid parentheses checker
@@ -195,12 +204,9 @@ def dsa_use_cases():
         Time Complexity: O(n), Space Complexity: O(n)
         """
         dq = deque(s)
-        reversed_chars = []
         
-        while dq:
-            reversed_chars.append(dq.pop())  # Pop from right
-        
-        return ''.join(reversed_chars)
+        # Walk from the right end in C instead of popping one char at a time
+        return ''.join(reversed(dq))
     
     test_string = "algorithm"
     reversed_string = reverse_string(test_string)
@@ -221,20 +227,23 @@ def dsa_use_cases():
         dq = deque()  # Store indices, maintain increasing order of values
         result = []
         
-        for i in range(len(nums)):
-            # Remove indices outside current window
-            while dq and dq[0] <= i - k:
-                dq.popleft()
+        push, pop, popleft = dq.append, dq.pop, dq.popleft
+        emit = result.append
+        
+        for i, value in enumerate(nums):
+            # At most one index leaves the window per step
+            if dq and dq[0] == i - k:
+                popleft()
             
             # Maintain monotonic property (remove larger elements)
-            while dq and nums[dq[-1]] >= nums[i]:
-                dq.pop()
+            while dq and nums[dq[-1]] >= value:
+                pop()
             
-            dq.append(i)
+            push(i)
             
             # Add minimum of current window to result
             if i >= k - 1:
-                result.append(nums[dq[0]])
+                emit(nums[dq[0]])
         
         return result
     
@@ -6,6 +6,20 @@ Useful for circular buffers, cyclic operations, and certain algorithmic patterns
 """
 
 from collections import deque
+from itertools import chain, islice
+
+_ALPHABET = 'abcdefghijklmnopqrstuvwxyz'
+
+def _build_caesar_tables():
+    """Precompute one translation table per shift by rotating the alphabet once per step"""
+    shifted = deque(_ALPHABET)
+    tables = []
+    for _ in range(len(_ALPHABET)):
+        tables.append(str.maketrans(_ALPHABET, ''.join(shifted)))
+        shifted.rotate(-1)  # Negative for forward shift
+    return tables
+
+_CAESAR_TABLES = _build_caesar_tables()
 
 def basic_rotation():
     """Demonstrates basic rotation operations"""
@@ -18,49 +32,46 @@ def basic_rotation():
     
     # 1. Rotate right (positive values)
     print("\n1. Rotating right (positive values):")
-    dq_copy = dq.copy()
+    dq.rotate(1)
+    print(f"rotate(1):  {dq}")
+    dq.rotate(-1)  # Undo instead of copying
     
-    dq_copy.rotate(1)
-    print(f"rotate(1):  {dq_copy}")
+    dq.rotate(2)
+    print(f"rotate(2):  {dq}")
+    dq.rotate(-2)
     
-    dq_copy = dq.copy()
-    dq_copy.rotate(2)
-    print(f"rotate(2):  {dq_copy}")
-    
-    dq_copy = dq.copy()
-    dq_copy.rotate(3)
-    print(f"rotate(3):  {dq_copy}")
+    dq.rotate(3)
+    print(f"rotate(3):  {dq}")
+    dq.rotate(-3)
     
     # 2. Rotate left (negative values)
     print("\n2. Rotating left (negative values):")
-    dq_copy = dq.copy()
-    dq_copy.rotate(-1)
-    print(f"rotate(-1): {dq_copy}")
+    dq.rotate(-1)
+    print(f"rotate(-1): {dq}")
+    dq.rotate(1)
     
-    dq_copy = dq.copy()
-    dq_copy.rotate(-2)
-    print(f"rotate(-2): {dq_copy}")
+    dq.rotate(-2)
+    print(f"rotate(-2): {dq}")
+    dq.rotate(2)
     
-    dq_copy = dq.copy()
-    dq_copy.rotate(-3)
-    print(f"rotate(-3): {dq_copy}")
+    dq.rotate(-3)
+    print(f"rotate(-3): {dq}")
+    dq.rotate(3)
     
     # 3. Full rotation
     print("\n3. Full rotations:")
-    dq_copy = dq.copy()
-    length = len(dq_copy)
+    length = len(dq)
     
-    dq_copy.rotate(length)
-    print(f"rotate({length}):  {dq_copy} (full rotation right)")
+    dq.rotate(length)
+    print(f"rotate({length}):  {dq} (full rotation right)")
     
-    dq_copy.rotate(-length)
-    print(f"rotate(-{length}): {dq_copy} (full rotation left)")
+    dq.rotate(-length)
+    print(f"rotate(-{length}): {dq} (full rotation left)")
     
     # 4. Zero rotation
     print("\n4. Zero rotation:")
-    dq_copy = dq.copy()
-    dq_copy.rotate(0)
-    print(f"rotate(0):  {dq_copy} (no change)")
+    dq.rotate(0)
+    print(f"rotate(0):  {dq} (no change)")
     print()
 
 def rotation_properties():
@@ -73,13 +84,13 @@ def rotation_properties():
     
     # 1. Rotation beyond length
     print("\n1. Rotation beyond deque length:")
-    dq_copy = dq.copy()
-    dq_copy.rotate(6)  # 6 % 4 = 2, same as rotate(2)
-    print(f"rotate(6): {dq_copy} (equivalent to rotate(2))")
+    dq.rotate(6)  # 6 % 4 = 2, same as rotate(2)
+    print(f"rotate(6): {dq} (equivalent to rotate(2))")
+    dq.rotate(-6)
     
-    dq_copy = dq.copy()
-    dq_copy.rotate(-6)  # -6 % 4 = -2, same as rotate(-2)
-    print(f"rotate(-6): {dq_copy} (equivalent to rotate(-2))")
+    dq.rotate(-6)  # -6 % 4 = -2, same as rotate(-2)
+    print(f"rotate(-6): {dq} (equivalent to rotate(-2))")
+    dq.rotate(6)
     
     # 2. Empty deque rotation
     print("\n2. Empty deque rotation:")
@@ -100,13 +111,13 @@ def rotation_properties():
     print(f"Original: {dq}")
     print("Think of it as: positive = move right edge to left, negative = move left edge to right")
     
-    dq_right = dq.copy()
-    dq_right.rotate(1)
-    print(f"rotate(1): {dq_right} <- last element moved to front")
+    dq.rotate(1)
+    print(f"rotate(1): {dq} <- last element moved to front")
+    dq.rotate(-1)
     
-    dq_left = dq.copy()
-    dq_left.rotate(-1)
-    print(f"rotate(-1): {dq_left} <- first element moved to end")
+    dq.rotate(-1)
+    print(f"rotate(-1): {dq} <- first element moved to end")
+    dq.rotate(1)
     print()
 
 def performance_comparison():
@@ -114,29 +125,33 @@ def performance_comparison():
     
     print("--- Performance Comparison ---")
     
-    import time
+    import timeit
     
     # Create large datasets
     size = 100000
+    steps = 1000
+    runs = 100
     large_deque = deque(range(size))
     large_list = list(range(size))
     
-    # Test deque rotation
-    start_time = time.time()
-    large_deque.rotate(1000)
-    deque_time = time.time() - start_time
+    # A single rotate finishes in microseconds, below what one clock read can
+    # resolve, so each method is run many times and the best batch is kept
+    
+    # Test deque rotation (in place, touches only `steps` pointers)
+    deque_time = min(timeit.repeat(
+        lambda: large_deque.rotate(steps), number=runs, repeat=3)) / runs
     
-    # Test manual list rotation (inefficient)
-    start_time = time.time()
-    k = 1000 % len(large_list)
-    rotated_list = large_list[-k:] + large_list[:-k]
-    list_time = time.time() - start_time
+    # Test list rotation by slicing (allocates two slices and a new list)
+    k = steps % len(large_list)
+    list_time = min(timeit.repeat(
+        lambda: large_list[-k:] + large_list[:-k], number=runs, repeat=3)) / runs
     
     print(f"Dataset size: {size:,} elements")
-    print(f"Rotation count: 1000")
-    print(f"Deque rotation time: {deque_time:.6f} seconds")
-    print(f"List rotation time: {list_time:.6f} seconds")
+    print(f"Rotation count: {steps}")
+    print(f"Deque rotation time: {deque_time * 1e6:.3f} microseconds")
+    print(f"List rotation time: {list_time * 1e6:.3f} microseconds")
     print(f"Deque is {list_time/deque_time:.1f}x faster")
+    print("Note: deque.rotate is O(k) in place, list slicing copies all n items")
     print()
 
 def dsa_use_cases():
@@ -147,6 +162,8 @@ def dsa_use_cases():
     # Use Case 1: Circular buffer implementation
     print("1. Circular Buffer:")
     class CircularBuffer:
+        __slots__ = ('buffer', 'size')
+        
         def __init__(self, size):
             self.buffer = deque(maxlen=size)
             self.size = size
@@ -161,9 +178,13 @@ def dsa_use_cases():
         
         def rotate_view(self, steps):
             """Rotate the view of buffer without changing data"""
-            view = deque(self.buffer)
-            view.rotate(steps)
-            return list(view)
+            n = len(self.buffer)
+            if not n:
+                return []
+            # Read the buffer from the rotation point, wrapping to the start,
+            # instead of copying it into a new deque and rotating that
+            start = -steps % n
+            return list(chain(islice(self.buffer, start, n), islice(self.buffer, start)))
         
         def __str__(self):
             return f"CircularBuffer({list(self.buffer)})"
@@ -185,16 +206,10 @@ def dsa_use_cases():
     def caesar_cipher(text, shift):
         """
         Implement Caesar cipher using deque rotation.
+        Tables for all 26 shifts are built once at import time.
         Time Complexity: O(n), Space Complexity: O(1) for alphabet
         """
-        alphabet = deque('abcdefghijklmnopqrstuvwxyz')
-        shifted_alphabet = deque(alphabet)
-        shifted_alphabet.rotate(-shift)  # Negative for forward shift
-        
-        # Create translation table
-        translation = str.maketrans(''.join(alphabet), ''.join(shifted_alphabet))
-        
-        return text.lower().translate(translation)
+        return text.lower().translate(_CAESAR_TABLES[shift % 26])
     
     def caesar_decrypt(text, shift):
         """Decrypt Caesar cipher"""
@@ -225,14 +240,14 @@ def dsa_use_cases():
     def rotate_array_in_place(nums, k):
         """
         Rotate array in place (modifies original list).
-        Uses deque for efficient rotation then copies back.
+        Splices the two slices back into the list, no deque round-trip.
         """
-        if not nums or k == 0:
+        if not nums:
             return
         
-        dq = deque(nums)
-        dq.rotate(k % len(nums))
-        nums[:] = dq
+        k %= len(nums)
+        if k:
+            nums[:] = nums[-k:] + nums[:-k]
     
     original = [1, 2, 3, 4, 5, 6, 7]
     k = 3
@@ -262,8 +277,7 @@ def dsa_use_cases():
         
         for i in range(len(arr) - window_size + 1):
             # Current window is the first 'window_size' elements
-            window = list(dq)[:window_size]
-            windows.append(window)
+            windows.append(list(islice(dq, window_size)))
             
             # Rotate to get next window position
             if i < len(arr) - window_size:
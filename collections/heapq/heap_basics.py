@@ -6,6 +6,8 @@ Essential for priority queues, finding k smallest/largest elements, and heap-bas
 """
 
 import heapq
+import itertools
+from operator import gt
 
 def heap_basics():
     """Demonstrates basic heap concepts and creation"""
@@ -43,16 +45,11 @@ def heap_basics():
     # Verify heap property
     def is_valid_heap(heap):
         """Check if list satisfies heap property"""
-        n = len(heap)
-        for i in range(n):
-            left = 2 * i + 1
-            right = 2 * i + 2
-            
-            if left < n and heap[i] > heap[left]:
-                return False
-            if right < n and heap[i] > heap[right]:
-                return False
-        return True
+        # heap[1::2] holds every left child and heap[2::2] every right child,
+        # so zipping each against the heap pairs heap[i] with its children;
+        # map stops at the shorter slice and the comparisons run in C
+        return not (any(map(gt, heap, heap[1::2])) or
+                    any(map(gt, heap, heap[2::2])))
     
     print(f"Is valid heap: {is_valid_heap(heap)}")
     print()
@@ -183,14 +180,14 @@ def dsa_use_case():
         
         def __init__(self):
             self.heap = []
-            self.entry_count = 0
+            # Tie-break numbers come from one C call per push instead of a
+            # load, add and store of a Python-level counter attribute
+            self._next_entry = itertools.count().__next__
         
         def push(self, priority, item):
             """Add item with given priority"""
-            # Use entry_count to break ties (FIFO for same priority)
-            entry = (priority, self.entry_count, item)
-            heapq.heappush(self.heap, entry)
-            self.entry_count += 1
+            # Entry number breaks ties (FIFO for same priority)
+            heapq.heappush(self.heap, (priority, self._next_entry(), item))
         
         def pop(self):
             """Remove and return item with lowest priority"""
@@ -212,6 +209,41 @@ def dsa_use_case():
         def size(self):
             return len(self.heap)
     
+    class IntPriorityQueue:
+        """
+        Priority queue for integer priorities that heaps plain ints.
+        Each entry packs (priority << 32) | entry_number into one int and the
+        items live in a dict keyed by entry number, so heapq compares ints
+        instead of tuples. Entry numbers must stay below 2**32.
+        """
+        
+        _ENTRY_BITS = 32
+        _ENTRY_MASK = (1 << _ENTRY_BITS) - 1
+        
+        def __init__(self):
+            self.heap = []
+            self.items = {}
+            self._next_entry = itertools.count().__next__
+        
+        def push(self, priority, item):
+            """Add item with given integer priority"""
+            entry = self._next_entry()
+            if entry > self._ENTRY_MASK:
+                # Would spill into the priority bits and misorder the heap
+                raise OverflowError("IntPriorityQueue supports at most 2**32 pushes")
+            self.items[entry] = item
+            heapq.heappush(self.heap, (priority << self._ENTRY_BITS) | entry)
+        
+        def pop(self):
+            """Remove and return item with lowest priority"""
+            if self.heap:
+                code = heapq.heappop(self.heap)
+                return code >> self._ENTRY_BITS, self.items.pop(code & self._ENTRY_MASK)
+            raise IndexError("Priority queue is empty")
+        
+        def is_empty(self):
+            return not self.heap
+    
     # Demonstrate priority queue
     pq = PriorityQueue()
     
@@ -235,6 +267,15 @@ def dsa_use_case():
     while not pq.is_empty():
         priority, task = pq.pop()
         print(f"Processing: priority={priority}, task='{task}'")
+    
+    # Same tasks through the packed-int variant give the same order
+    int_pq = IntPriorityQueue()
+    for priority, task in tasks:
+        int_pq.push(priority, task)
+    packed_order = []
+    while not int_pq.is_empty():
+        packed_order.append(int_pq.pop()[1])
+    print(f"\nIntPriorityQueue order: {packed_order}")
 
 if __name__ == "__main__":
     heap_basics()
@@ -8,6 +8,7 @@ elements without fully sorting the data. Essential for top-K problems in algorit
 import heapq
 import random
 import time
+from itertools import islice
 
 def nlargest_examples():
     """Demonstrates nlargest function usage"""
@@ -132,14 +133,15 @@ def performance_comparison():
     sort_time = time.time() - start_time
     
     # Method 3: Manual heap approach
+    # Heapify the first k items, then heapreplace does the pop and push
+    # in a single sift, as nlargest does internally
     start_time = time.time()
-    heap = []
-    for num in data:
-        if len(heap) < k:
-            heapq.heappush(heap, num)
-        elif heap[0] < num:
-            heapq.heappop(heap)
-            heapq.heappush(heap, num)
+    heap = data[:k]
+    heapq.heapify(heap)
+    heapreplace = heapq.heapreplace
+    for num in islice(data, k, None):
+        if heap[0] < num:
+            heapreplace(heap, num)
     result3 = sorted(heap, reverse=True)
     manual_heap_time = time.time() - start_time
     
@@ -200,9 +202,14 @@ def dsa_use_cases():
     def find_kth_largest(nums, k):
         """
         Find the kth largest element.
-        Time Complexity: O(n log k)
+        Time Complexity: O(n log min(k, n - k + 1))
         """
-        return heapq.nlargest(k, nums)[-1]
+        # The kth largest is also the (n - k + 1)th smallest, so keep
+        # whichever heap is smaller when k is past the middle
+        rank_from_bottom = len(nums) - k + 1
+        if k <= rank_from_bottom:
+            return heapq.nlargest(k, nums)[-1]
+        return heapq.nsmallest(rank_from_bottom, nums)[-1]
     
     nums = [3, 2, 3, 1, 2, 4, 5, 5, 6]
     k = 4
@@ -221,8 +228,10 @@ def dsa_use_cases():
         
         count = Counter(words)
         
-        # Use nlargest with custom key for frequency (desc) and word (asc)
-        return heapq.nlargest(k, count.keys(), key=lambda w: (count[w], -ord(w[0])))
+        # Key on (word, count) pairs directly: negated count puts higher
+        # frequency first and the full word breaks ties ascending
+        top = heapq.nsmallest(k, count.items(), key=lambda item: (-item[1], item[0]))
+        return [word for word, _ in top]
     
     words = ["i", "love", "leetcode", "i", "love", "coding"]
     k = 2
@@ -38,8 +38,6 @@ def heappop_examples():
     print(f"Initial heap: {heap}")
     
     print("\nPopping elements:")
-    original_heap = heap.copy()
-    
     while heap:
         min_element = heapq.heappop(heap)
         print(f"Popped {min_element}: remaining = {heap}")
@@ -124,6 +122,11 @@ def performance_characteristics():
     # Test with different heap sizes
     sizes = [1000, 10000, 100000]
     
+    # Bind the heap functions once so the timed loops measure the heap
+    # operations, not a global and attribute lookup per call
+    push = heapq.heappush
+    pop = heapq.heappop
+    
     for size in sizes:
         # Generate random data
         data = [random.randint(1, 1000000) for _ in range(size)]
@@ -132,14 +135,15 @@ def performance_characteristics():
         heap = []
         start_time = time.time()
         for element in data:
-            heapq.heappush(heap, element)
+            push(heap, element)
         push_time = time.time() - start_time
         
         # Test heappop performance
         start_time = time.time()
         results = []
+        keep = results.append
         while heap:
-            results.append(heapq.heappop(heap))
+            keep(pop(heap))
         pop_time = time.time() - start_time
         
         print(f"Size: {size:,}")
@@ -164,19 +168,10 @@ def dsa_use_cases():
         if k >= len(arr):
             return sorted(arr)
         
-        # Use max heap to keep track of k smallest
-        # Python heapq is min heap, so use negative values for max heap
-        max_heap = []
-        
-        for num in arr:
-            if len(max_heap) < k:
-                heapq.heappush(max_heap, -num)  # Negative for max heap
-            elif -max_heap[0] > num:  # Current max > new number
-                heapq.heappop(max_heap)
-                heapq.heappush(max_heap, -num)
-        
-        # Convert back to positive and sort
-        return sorted([-x for x in max_heap])
+        # nsmallest keeps a size-k max heap of the k smallest so far and
+        # replaces its root in one sift, without negating every value
+        # to fake a max heap on top of heapq's min heap
+        return heapq.nsmallest(k, arr)
     
     arr = [7, 10, 4, 3, 20, 15]
     k = 3
@@ -192,26 +187,9 @@ def dsa_use_cases():
         Merge k sorted lists using heap.
         Time Complexity: O(n log k) where n is total elements
         """
-        import itertools
-        
-        heap = []
-        result = []
-        
-        # Add first element from each list to heap
-        for i, lst in enumerate(lists):
-            if lst:
-                heapq.heappush(heap, (lst[0], i, 0))  # (value, list_index, element_index)
-        
-        while heap:
-            value, list_idx, elem_idx = heapq.heappop(heap)
-            result.append(value)
-            
-            # Add next element from the same list
-            if elem_idx + 1 < len(lists[list_idx]):
-                next_value = lists[list_idx][elem_idx + 1]
-                heapq.heappush(heap, (next_value, list_idx, elem_idx + 1))
-        
-        return result
+        # heapq.merge keeps one (value, order, iterator) entry per list and
+        # advances the iterators itself, so there is no index bookkeeping
+        return list(heapq.merge(*lists))
     
     sorted_lists = [
         [1, 4, 5],
@@ -243,8 +221,8 @@ def dsa_use_cases():
             if len(heap) < k:
                 heapq.heappush(heap, (freq, num))
             elif heap[0][0] < freq:
-                heapq.heappop(heap)
-                heapq.heappush(heap, (freq, num))
+                # Swap out the least frequent in one sift instead of pop + push
+                heapq.heapreplace(heap, (freq, num))
         
         # Extract elements (order doesn't matter for this problem)
         return [num for freq, num in heap]
@@ -262,6 +240,10 @@ def dsa_use_cases():
         """
         Find median of a stream of numbers using two heaps.
         """
+        
+        # Only the two heaps are stored, so skip the per-instance __dict__
+        __slots__ = ('small', 'large')
+        
         def __init__(self):
             self.small = []  # Max heap (use negative values)
             self.large = []  # Min heap